@@ -1,6 +1,8 @@
+import numpy as np
 import pandas as pd
 
 from emspy import EmsPy
+from emspy.emspy import CallbackSpec
 
 
 class BcaEnv(EmsPy):
@@ -13,6 +15,8 @@ class BcaEnv(EmsPy):
     completely through this class.
     """
 
+    non_numeric_timing_metrics = ['t_datetimes']  # cannot be packed into a numeric state vector
+
     # Building Control Agent (bca) & Environment
     def __init__(self, ep_path: str,
                  ep_idf_to_run: str,
@@ -27,7 +31,10 @@ class BcaEnv(EmsPy):
 
         # follow same init procedure as parent class emspy
         super().__init__(ep_path, ep_idf_to_run, timesteps, tc_vars, tc_intvars, tc_meters, tc_actuator, tc_weather)
-        self.ems_list_update_checked = False  # TODO get rid off, doesnt work with multiple method instances
+
+        # fixed state vector, see register_state_vector()
+        self._state_data_lists = ()
+        self._state_buf = np.empty(0, dtype=np.float64)
 
     def set_calling_point_and_callback_function(self, calling_point: str,
                                                 observation_function,
@@ -67,9 +74,11 @@ class BcaEnv(EmsPy):
             raise Exception(
                 f'ERROR: You have overwritten the calling point \'{calling_point}\'. Keep calling points unique.')
         else:
-            self.calling_point_callback_dict[calling_point] = [observation_function, actuation_function, update_state,
-                                                               update_observation_frequency, update_actuation_frequency,
-                                                               observation_function_kwargs, actuation_function_kwargs]
+            self.calling_point_callback_dict[calling_point] = CallbackSpec(observation_function, actuation_function,
+                                                                           update_state, update_observation_frequency,
+                                                                           update_actuation_frequency,
+                                                                           observation_function_kwargs,
+                                                                           actuation_function_kwargs)
 
     def _check_ems_metric_input(self, ems_metric):
         """Verifies user-input of EMS metric/type list is valid."""
@@ -79,11 +88,21 @@ class BcaEnv(EmsPy):
             raise Exception(f'ERROR: EMS categories can only be called by themselves, please only call one at a '
                             f'time.')
         # catch invalid EMS metric names
-        elif ems_metric not in self.ems_names_master_list and ems_metric not in self.available_timing_metrics:
+        elif ems_metric not in self._ems_names_set:
             raise Exception(f'ERROR: The EMS/timing metric [{ems_metric}] is not valid. Please see your EMS ToCs'
                             f' or emspy.ems_master_list & emspy.times_master_list for available EMS & '
                             f'timing metrics')
 
+    def _get_ems_data_list(self, ems_metric: str) -> list:
+        """Returns the data list of given EMS/timing metric, verifying input only if it is not already tracked."""
+
+        try:
+            return self.ems_data_list_dict[ems_metric]
+        except KeyError:
+            self._check_ems_metric_input(ems_metric)  # raises for invalid input
+            raise ValueError(f'ERROR: The EMS/timing metric [{ems_metric}] has no tracked data, it may be an unused '
+                             f'actuator or an untracked timing metric.')
+
     def get_ems_data(self, ems_metric_list: list, time_reverse_index=0, return_dict: bool = False):
         """
         This takes desired EMS metric(s) (or type) & returns the entire current data set(s) OR at specific time indices.
@@ -96,27 +115,37 @@ class BcaEnv(EmsPy):
 
         If calling any default timing data, see emspy.available_timing_metrics for available timing data.
 
-        :param ems_metric_list: list of strings (or single element) of any available EMS/timing metric(s) to be called,
-        or ONLY ONE entire EMS category ('var', 'intvar', 'meter', 'actuator', 'weather', 'time')
-        :param time_reverse_index: list (or single value) of timestep indexes, applied to all EMS/timing metrics starting
-        from index 0 as most recent available data point. Passing an empty list [] will return the entire current data
-        list for each specified EMS metric.
+        :param ems_metric_list: list/tuple of strings (or single element) of any available EMS/timing metric(s) to be
+        called, or ONLY ONE entire EMS category ('var', 'intvar', 'meter', 'actuator', 'weather', 'time')
+        :param time_reverse_index: list/tuple/range/array (or single value) of timestep indexes, applied to all
+        EMS/timing metrics starting from index 0 as most recent available data point. Passing an empty list [] will
+        return the entire current data list for each specified EMS metric.
         :param return_dict: True if you want to return data in dictionary format, with EMS name as the key, otherwise
         raw list will be returned in order of EMS items in the input list or EMS ToC
         :return return_data_list: nested list of data for each EMS metric at each time index specified, or entire list
         """
 
+        # fast path, single metric at single time index
+        if type(ems_metric_list) is str and type(time_reverse_index) is int and not return_dict:
+            ems_data = self.ems_data_list_dict.get(ems_metric_list)
+            if ems_data is not None:
+                try:
+                    return ems_data[-1 - time_reverse_index]
+                except IndexError:
+                    pass  # let general path handle
+
         # Handle single val inputs -> convert to list for rest of function
         single_val = False
         single_metric = False
         # metrics
-        if type(ems_metric_list) is not list:  # assuming single metric
-            ems_metric_list = [ems_metric_list]
+        if not isinstance(ems_metric_list, (list, tuple)):  # assuming single metric
+            ems_metric_list = (ems_metric_list,)
         if len(ems_metric_list) == 1:
             single_metric = True
         # time indexes
-        if type(time_reverse_index) is not list and type(time_reverse_index) is not range:  # assuming single time
-            time_reverse_index = [time_reverse_index]  # make single time iterable
+        if not isinstance(time_reverse_index, (list, tuple, range, np.ndarray)):  # assuming single time
+            time_reverse_index = (time_reverse_index,)  # make single time iterable
+        all_times = len(time_reverse_index) == 0  # return ALL current data
         if len(time_reverse_index) == 1:
             single_val = True
 
@@ -142,27 +171,20 @@ class BcaEnv(EmsPy):
             return_data = []  # organized by order, only raw values
 
         for ems_metric in ems_metric_list:
+            ems_data = self._get_ems_data_list(ems_metric)
 
-            # TODO do once, again at each timestep is redundant?
-            # self._check_ems_metric_input(ems_metric)  # verify valid input
-            ems_type = self._get_ems_type(ems_metric)  # for attribute variable name
-
-            if not time_reverse_index:
-                # no time index specified, return ALL current data available,  #TODO this doens't compensate for time data
+            if all_times:
+                # no time index specified, return ALL current data available
                 if return_dict:
-                    return_data[ems_metric] = getattr(self, 'data_' + ems_type + '_' + ems_metric)
+                    return_data[ems_metric] = ems_data
                 else:
-                    return_data.append(getattr(self, 'data_' + ems_type + '_' + ems_metric))
+                    return_data.append(ems_data)
             else:
                 # iterate through previous time indexes
                 return_data_indexed = []
                 for time in time_reverse_index:
-                    if ems_type != 'time':
-                        ems_name = 'data_' + ems_type + '_' + ems_metric
-                    else:
-                        ems_name = ems_metric  # TODO update timing metrics
                     try:
-                        data_indexed = getattr(self, ems_name)[-1 - time]
+                        data_indexed = ems_data[-1 - time]
                         if single_val:
                             return_data_indexed = data_indexed  # so that nested list of single-element is Not returned
                         else:
@@ -186,6 +208,41 @@ class BcaEnv(EmsPy):
 
         return return_data
 
+    def register_state_vector(self, ems_metric_list: list):
+        """
+        Fixes an ordered list of EMS/timing metrics whose most recent values make up the agent's state vector.
+
+        Each metric is resolved to its data list once here, so get_state_vector() can be called every timestep without
+        any metric lookup or list building. Only numeric EMS, weather, or timing metrics are allowed, see
+        BcaEnv.non_numeric_timing_metrics.
+
+        :param ems_metric_list: ordered list of any available numeric EMS/timing metric(s) making up the state vector
+        """
+
+        for ems_metric in ems_metric_list:
+            if ems_metric in self.non_numeric_timing_metrics:
+                raise ValueError(f'ERROR: The timing metric [{ems_metric}] is not numeric and cannot be part of the '
+                                 f'state vector.')
+        self._state_data_lists = tuple(self._get_ems_data_list(ems_metric) for ems_metric in ems_metric_list)
+        self._state_buf = np.empty(len(self._state_data_lists), dtype=np.float64)
+
+    def get_state_vector(self, copy: bool = True) -> np.ndarray:
+        """
+        Returns the most recent values of the registered state vector metrics, see register_state_vector().
+
+        This must be called after the first state update of the simulation, otherwise an IndexError is raised since no
+        data is available yet.
+
+        :param copy: False to return the internal buffer itself, which is overwritten on the next call
+        :return: numpy array of the latest data point of each registered EMS/timing metric, in registered order
+        """
+
+        state_buf = self._state_buf
+        for i, ems_data in enumerate(self._state_data_lists):
+            state_buf[i] = ems_data[-1]
+
+        return state_buf.copy() if copy else state_buf
+
     def get_weather_forecast(self, weather_metrics: list, when: str, hour: int, zone_ts: int):
         """
         Fetches given weather metric from today/tomorrow for a given hour of the day and timestep within that hour.
@@ -221,12 +278,8 @@ class BcaEnv(EmsPy):
             # if only single EMS category called
             ems_metric_list = list(getattr(self, 'tc_' + ems_metric_list[0]).keys())
         else:
-            # TODO get rid of, doesnt work with multiple method instances - OR make work with multiple
-            if not self.ems_list_update_checked:
-                for ems_metric in ems_metric_list:
-                    self._check_ems_metric_input(ems_metric)
-                    self.ems_list_update_checked = True
-                    print('Check once 1')
+            for ems_metric in ems_metric_list:
+                self._get_ems_data_list(ems_metric)  # verify valid input
 
         self._update_ems_and_weather_vals(ems_metric_list)
         if return_data:
@@ -280,8 +333,9 @@ class BcaEnv(EmsPy):
         if to_csv_file is None:
             to_csv_file = ''
 
-        all_df = pd.DataFrame()  # merge all into 1 df
+        all_dfs = []  # concat all default & custom dfs into 1 df
         return_df = {}
+        df_time_columns = ['Datetime', 'Timestep', 'Calling Point']
 
         # handle DEFAULT dfs
         df_default_names = list(self.ems_num_dict.keys()) + ['reward'] if self.rewards else self.ems_num_dict.keys()
@@ -291,15 +345,14 @@ class BcaEnv(EmsPy):
                 df = (getattr(self, 'df_' + df_name))  # create df for EMS type
                 return_df[df_name] = df
 
-                # create complete DF of all default vars with only 1 set of time/index columns
-                if all_df.empty:
-                    all_df = df.copy(deep=True)
+                # create complete DF of all default vars with only 1 set of time/index columns, all rows align
+                if not all_dfs:
+                    all_dfs.append(df)
+                elif df_name == 'reward' and len(self.rewards) != len(self.t_datetimes):
+                    # include reward to ALL DFs only if its the same size
+                    print('*NOTE: Rewards DF will not be included on ALL DF as it is not the same size.')
                 else:
-                    if df_name == 'reward' and len(self.rewards) != self.t_datetimes:
-                        # include reward to ALL DFs only if its the same size
-                        print('*NOTE: Rewards DF will not be included on ALL DF as it is not the same size.')
-                    else:
-                        all_df = pd.merge(all_df, df, on=['Datetime', 'Timestep', 'Calling Point'])
+                    all_dfs.append(df.drop(columns=df_time_columns))
 
                 # remove from list since accounted for
                 if df_name in df_names:
@@ -310,14 +363,14 @@ class BcaEnv(EmsPy):
             if df_name in df_names or not df_names:
                 df = (getattr(self, df_name))
                 return_df[df_name] = df
-                if all_df.empty:
-                    all_df = df.copy(deep=True)
-                else:  # TODO verify robustness of merging of custom df with default, can it be compressed for same time indexes
-                    all_df = pd.concat([all_df, df], axis=1)
-                    # TODO determine why custom dfs do not add to all_df well, num of indexes is wrong
+                # TODO verify robustness of merging of custom df with default, can it be compressed for same time indexes
+                # TODO determine why custom dfs do not add to all_df well, num of indexes is wrong
+                all_dfs.append(df)
                 if df_name in df_names:
                     df_names.remove(df_name)
 
+        all_df = pd.concat(all_dfs, axis=1) if all_dfs else pd.DataFrame()
+
         # leftover dfs not fetched and returned
         if df_names:
             raise ValueError(f'ERROR: Either dataframe custom name or default type: {df_names} is not valid or was not'
@@ -11,10 +11,15 @@ Unmet Hours help forum https://unmethours.com/questions/
 import sys
 import operator
 import datetime
+from collections import namedtuple
 
 import pandas as pd
 import numpy as np
 
+# user-specified callback setup of a single calling point, see BcaEnv.set_calling_point_and_callback_function()
+CallbackSpec = namedtuple('CallbackSpec', 'observation_fxn actuation_fxn update_state update_observation_freq '
+                                          'update_actuation_freq observation_fxn_kwargs actuation_fxn_kwargs')
+
 
 class EmsPy:
     """A meta-class wrapper to the EnergyPlus Python API to simplify/constrain usage for RL-algorithm purposes."""
@@ -96,6 +101,11 @@ class EmsPy:
 
         self.pyapi = pyenergyplus.api
         self.api = EnergyPlusAPI()  # instantiation of Python EMS API
+        # specific data exchange API function calls, per EMS type
+        self.ems_datax_func = {'var': self.api.exchange.get_variable_value,
+                               'intvar': self.api.exchange.get_internal_variable_value,
+                               'meter': self.api.exchange.get_meter_value,
+                               'actuator': self.api.exchange.get_actuator_value}
 
         # instance important
         self.state = self._new_state()
@@ -125,6 +135,8 @@ class EmsPy:
         self.ems_type_dict = {}  # keep track of EMS metric names and associated EMS type, quick lookup
         self.ems_num_dict = {}  # keep track of EMS categories and num of vars for each tracked
         self.ems_current_data_dict = {}  # collection of all ems metrics (keys) and their current values (val)
+        self.ems_handle_dict = {}  # EMS metric names (key) and their runtime handle (val), quick lookup
+        self.ems_data_list_dict = {}  # EMS/timing metric names (key) and their data list attribute (val), quick lookup
         self.calling_point_callback_dict = {}  # links cp to callback fxn & its needed args
 
         # create attributes of sensor and actuator .idf handles and data arrays
@@ -133,6 +145,7 @@ class EmsPy:
         self.static_vars_obtained = False  # static (internal) variables, gather once
         # create attributes for weather
         self._init_weather_data()  # creates weather_data = [] attribute, useful for present/prior weather data tracking
+        self._ems_names_set = frozenset(self.ems_names_master_list)  # quick membership lookup of all EMS/timing names
 
         # timing data
         self.t_actual_date_times = []
@@ -159,6 +172,11 @@ class EmsPy:
         self.callbacks_count = []
         self.callback_current_count = 0
 
+        # timing data lists, same quick lookup as EMS data lists
+        for t in self.available_timing_metrics:
+            if hasattr(self, t):
+                self.ems_data_list_dict[t] = getattr(self, t)
+
         # reward data  # TODO does this have to be handled by this class?
         self.rewards_created = False
         self.rewards_multi = False
@@ -168,6 +186,7 @@ class EmsPy:
 
         # simulation data
         self._actuators_used_set = set()  # keep track of what EMS actuators are actually actuated
+        self._no_actuation_calling_points_set = set()  # calling points already reported with no actuation values
         self.simulation_success = 1  # 1 fail, 0 success
 
         print('\n*NOTE: Simulation emspy class and instance created!')
@@ -195,10 +214,14 @@ class EmsPy:
                         raise ValueError(f'ERROR: EMS metric user-defined names must be unique, '
                                          f'{ems_name}({self.ems_type_dict[ems_name]}) != {ems_name}({ems_type})')
                     setattr(self, 'handle_' + ems_type + '_' + ems_name, None)  # real handle found at runtime
-                    setattr(self, 'data_' + ems_type + '_' + ems_name, [])  # init as empty list
+                    ems_data = []  # init as empty list
+                    setattr(self, 'data_' + ems_type + '_' + ems_name, ems_data)
+                    self.ems_data_list_dict[ems_name] = ems_data
                     if ems_type == 'actuator':  # handle associated actuator setpoints
                         setpoint_name = 'setpoint_' + ems_name
-                        setattr(self, 'data_' + setpoint_name, [])
+                        setpoint_data = []
+                        setattr(self, 'data_' + setpoint_name, setpoint_data)
+                        self.ems_data_list_dict[setpoint_name] = setpoint_data
                         self.ems_type_dict[setpoint_name] = 'setpoint'
                         self.ems_names_master_list.append(setpoint_name)
                     self.ems_type_dict[ems_name] = ems_type
@@ -221,7 +244,9 @@ class EmsPy:
                 if weather_name in self.ems_names_master_list:
                     raise ValueError(f'ERROR: EMS metric user-defined names must be unique, '
                                      f'{weather_name}({self.ems_type_dict[weather_name]}) != {weather_name}(weather)')
-                setattr(self, 'data_weather_' + weather_name, [])
+                weather_data = []
+                setattr(self, 'data_weather_' + weather_name, weather_data)
+                self.ems_data_list_dict[weather_name] = weather_data
                 self.ems_names_master_list.append(weather_name)
                 self.ems_type_dict[weather_name] = 'weather'
             self.ems_num_dict['weather'] = len(self.tc_weather)
@@ -273,7 +298,9 @@ class EmsPy:
             ems_tc = getattr(self, 'tc_' + ems_type)
             if ems_tc is not None:
                 for name, handle_inputs in ems_tc.items():
-                    setattr(self, 'handle_' + ems_type + '_' + name, self._get_handle(ems_type, handle_inputs))
+                    handle = self._get_handle(ems_type, handle_inputs)
+                    setattr(self, 'handle_' + ems_type + '_' + name, handle)
+                    self.ems_handle_dict[name] = handle
         print('\n*NOTE: Got all EMS handles.\n')
 
     def _get_handle(self, ems_type: str, ems_obj_details):
@@ -367,19 +394,14 @@ class EmsPy:
     def _update_ems_data_attributes(self, ems_type: str, ems_name: str, data_val: float):
         """Helper function to update EMS attributes with current values."""
 
-        getattr(self, 'data_' + ems_type + '_' + ems_name).append(data_val)
+        self.ems_data_list_dict[ems_name].append(data_val)
         self.ems_current_data_dict[ems_name] = data_val
 
     def _update_ems_and_weather_vals(self, ems_metrics_list: list):
         """Fetches and updates given sensor/actuator/weather values to data lists/dicts from running simulation."""
 
         # TODO how to handle user-specified TIMING updates separate from state, right now they are joint
-        # specific data exchange API function calls
-        datax = self.api.exchange
-        ems_datax_func = {'var': datax.get_variable_value,
-                          'intvar': datax.get_internal_variable_value,
-                          'meter': datax.get_meter_value,
-                          'actuator': datax.get_actuator_value}
+        ems_datax_func = self.ems_datax_func
 
         for ems_name in ems_metrics_list:
             ems_type = self.ems_type_dict[ems_name]
@@ -390,11 +412,11 @@ class EmsPy:
                 data_i = self._get_weather([ems_name], 'today', self.t_hours[-1], self.timestep_zone_num_current)
             elif ems_type == 'intvar':  # internal(static) vars updated ONCE, separately
                 if not self.static_vars_obtained:
-                    data_i = ems_datax_func[ems_type](self.state, getattr(self, 'handle_' + ems_type + '_' + ems_name))
+                    data_i = ems_datax_func[ems_type](self.state, self.ems_handle_dict[ems_name])
                     self.static_vars_obtained = True
             else:  # rest: var, meter, actuator
                 # get data from E+ sim
-                data_i = ems_datax_func[ems_type](self.state, getattr(self, 'handle_' + ems_type + '_' + ems_name))
+                data_i = ems_datax_func[ems_type](self.state, self.ems_handle_dict[ems_name])
 
             # store data in obj attributes
             self._update_ems_data_attributes(ems_type, ems_name, data_i)
@@ -493,14 +515,16 @@ class EmsPy:
                     raise Exception(f'ERROR: Either this actuator [{actuator_name}] is not tracked, or misspelled.'
                                     f' Check your Actuator ToC.')
                 # actuate and update data tracking
-                actuator_handle = getattr(self, 'handle_actuator_' + actuator_name)
+                actuator_handle = self.ems_handle_dict[actuator_name]
                 self._actuate(actuator_handle, actuator_setpoint)
                 self._actuators_used_set.add(actuator_name)  # to keep track of what actuators from TC are actually used
                 # update SETPOINT value of actuators
-                getattr(self, 'data_setpoint_' + actuator_name).append(actuator_setpoint)
-        else:
+                self.ems_data_list_dict['setpoint_' + actuator_name].append(actuator_setpoint)
+        elif calling_point not in self._no_actuation_calling_points_set:
+            # only report once per calling point, not every timestep
             print(f'\n*NOTE: No actuators/values defined for actuation function at calling point [{calling_point}],'
                   f' timestep [{self.timestep_zone_num_current}]\n')
+            self._no_actuation_calling_points_set.add(calling_point)
 
     def _enclosing_callback(self, calling_point: str, observation_fxn, actuation_fxn,
                             update_state: bool = False,
@@ -625,12 +649,10 @@ class EmsPy:
                                 f' the Python API 0.2 documentation and available calling point list: '
                                 f'emspy.available_calling_points class attribute.')
             else:
-                # unpack observation & actuation fxns and callback fxn arguments
-                observation_fxn, actuation_fxn, update_state, update_observation_freq, update_act_freq, \
-                observation_fxn_kwargs, actuation_fxn_kwargs = self.calling_point_callback_dict[calling_key]
+                callback_spec = self.calling_point_callback_dict[calling_key]
 
                 # verify only one EMS update per timestep is advised
-                if update_state:
+                if callback_spec.update_state:
                     update_cp_list.append(calling_key)
                     if update_state_callback:
                         print(f'*WARNING: You are updating your entire EMS state multiple times a timestep, '
@@ -639,24 +661,18 @@ class EmsPy:
 
                 # via API, establish calling points at runtime and create/pass its custom callback function
                 getattr(self.api.runtime, calling_key)(self.state, self._enclosing_callback(calling_key,
-                                                                                            observation_fxn,
-                                                                                            actuation_fxn,
-                                                                                            update_state,
-                                                                                            update_observation_freq,
-                                                                                            update_act_freq,
-                                                                                            observation_fxn_kwargs,
-                                                                                            actuation_fxn_kwargs))
+                                                                                            *callback_spec))
 
                 # report message summary to user
-                actuation_msg = 'Yes' if actuation_fxn is not None else 'No'
-                observation_msg = 'Yes' if observation_fxn is not None else 'No'
+                actuation_msg = 'Yes' if callback_spec.actuation_fxn is not None else 'No'
+                observation_msg = 'Yes' if callback_spec.observation_fxn is not None else 'No'
                 print(f'\n*NOTE: Callback Function Summary:'
                       f'\n\t\t\t- Calling Point [{calling_key}]'
                       f'\n\t\t\t- Observation: [{observation_msg}]'
                       f'\n\t\t\t- Actuation: [{actuation_msg}]'
-                      f'\n\t\t\t- State Update: [{update_state}]'
-                      f'\n\t\t\t- State Update Freq: [{update_observation_freq}]'
-                      f'\n\t\t\t- Action Update Freq: [{update_act_freq}]')
+                      f'\n\t\t\t- State Update: [{callback_spec.update_state}]'
+                      f'\n\t\t\t- State Update Freq: [{callback_spec.update_observation_freq}]'
+                      f'\n\t\t\t- Action Update Freq: [{callback_spec.update_actuation_freq}]')
 
     def _create_default_dataframes(self):
         """
@@ -726,7 +742,7 @@ class EmsPy:
                 is_reward = ''
             for metric in ems_metrics:
                 # verify proper input
-                if metric not in self.ems_names_master_list + [is_reward]:
+                if metric not in self._ems_names_set and metric != is_reward:
                     raise Exception(f'ERROR: Incorrect EMS metric name, [{metric}], was entered for custom '
                                     f'dataframes.')
                 # unused actuators
@@ -766,13 +782,8 @@ class EmsPy:
                         else:
                             data_i = self.rewards[-1]
                     else:
-                        # normal ems types
-                        ems_type = self._get_ems_type(ems_name)
-                        if ems_type == 'setpoint':  # actuator setpoints
-                            data_list_name = 'data_' + ems_name  # setpoint is redundant, user must input themselves
-                        else:  # all other
-                            data_list_name = 'data_' + ems_type + '_' + ems_name
-                        data_i = getattr(self, data_list_name)[-1]
+                        # normal ems types, and actuator setpoints
+                        data_i = self.ems_data_list_dict[ems_name][-1]
 
                     # append to dict list
                     self.df_custom_dict[df_name][0][ems_name].append(data_i)
@@ -809,6 +820,7 @@ class EmsPy:
                           f"null data attributes will be removed.")
                     # remove their data attributes
                     delattr(self, 'data_actuator_' + actuator_name)
+                    self.ems_data_list_dict.pop(actuator_name)
                     unused_actuators.append(actuator_name)
             # update EMS actuator number dictionary - relates to default DF creation,
             original_num = self.ems_num_dict['actuator']
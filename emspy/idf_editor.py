@@ -2,10 +2,29 @@
 This program is to help automate simple repetitive tasks with EnergyPlus building model file (.IDF) modifications.
 """
 
+import io
 import os
+import shutil
 import tempfile
 
 
+def _copy_idf(idf, output):
+    """Streams the contents of an IDF file (or its path) into an open output file, without reading it all at once."""
+
+    if isinstance(idf, str):
+        with open(idf) as idf_data:
+            shutil.copyfileobj(idf_data, output)
+    else:
+        shutil.copyfileobj(idf, output)
+
+
+def _is_same_file(idf, file_path: str) -> bool:
+    """Checks if an IDF file (or its path) input is the same existing file as the given path."""
+
+    return isinstance(idf, str) and os.path.exists(idf) and os.path.exists(file_path) and \
+        os.path.samefile(idf, file_path)
+
+
 def append_idf(idf_file, idf_append, output_file_name=""):
     """ This takes two files (or their paths) as input, concatenates them, and writes it to a third file.
 
@@ -14,45 +33,47 @@ def append_idf(idf_file, idf_append, output_file_name=""):
     :param output_file_name: File name / path of output file. Leave blank to overwrite base "idf_file" in place.
     """
 
-    # check for file/path input
-    if isinstance(idf_file, str):
-        # if path passed
-        if not output_file_name:  # overwrite base file
-            output_file_name = idf_file
-        with open(idf_file) as idf_data:
-            idf_file = idf_data.read()
-    if isinstance(idf_append, str):
-        with open(idf_append) as append_data:
-            idf_append = append_data.read()
-
-    # merge files segments
-    idf_file += '\n' + idf_append
-
-    with open(output_file_name, 'w') as output:
-        output.write(idf_file)
+    # verify input files exist before any output file is created or truncated
+    for idf in (idf_file, idf_append):
+        if isinstance(idf, str) and not os.path.isfile(idf):
+            raise FileNotFoundError(f'ERROR: IDF file [{idf}] does not exist.')
+
+    if not output_file_name:  # overwrite base file
+        output_file_name = idf_file
+    output_is_base = _is_same_file(idf_file, output_file_name)
+    output_is_append = _is_same_file(idf_append, output_file_name)
+
+    # check for in place append, base file does not need to be read and rewritten
+    if output_is_base and not output_is_append:
+        with open(output_file_name, 'a') as output:
+            output.write('\n')
+            _copy_idf(idf_append, output)
+    elif output_is_base or output_is_append:
+        # output overwrites an input, merge into temp file of same dir first, then replace output
+        with tempfile.NamedTemporaryFile('w', dir=os.path.dirname(os.path.abspath(output_file_name)),
+                                         suffix='.idf', delete=False) as output:
+            try:
+                _copy_idf(idf_file, output)
+                output.write('\n')
+                _copy_idf(idf_append, output)
+            except BaseException:
+                output.close()
+                os.unlink(output.name)  # don't leave temp file in model dir
+                raise
+        shutil.copymode(output_file_name, output.name)  # keep permissions of replaced file
+        os.replace(output.name, output_file_name)
+    else:
+        # merge files segments
+        with open(output_file_name, 'w') as output:
+            _copy_idf(idf_file, output)
+            output.write('\n')
+            _copy_idf(idf_append, output)
 
     return output_file_name
 
 
-def insert_custom_data_tracking(custom_name: str, idf_file_path: str, unit_type: str = 'Dimensionless'):
-    """
-    This inserts an workaround into the IDF to allow for custom data insertion and tracking through EnergyPlys.
-
-    This feature is useful if you want to track your own data as an "Output:Variable", thus including it in the SQL
-    output generation, and usable in DView.
-    This is done by creating a "Schedule:Const" object, then the user must utilize a schedule actuator to insert data
-    at each timestep. Thus, both a "Output:Variable" and "Schedule:Const" will be created.
-    The ScheduleTypeLimits are also created accordingly to meet specifications for the custom Schedule:Const.
-
-    Using this with the ToC Actuators is shown as such, where 'Custom Data Tracked' is your name for the IDF object and
-    'my_data_var' is used to reference it via ToC in your script.
-    Ex:
-        'my_data_var': ['Schedule:Constant', 'Schedule Value', 'Custom Data Tracked'],
-
-    :param custom_name: name (str) of data object to create and track (can have spaces).
-    :param idf_file_path: Path to IDF model file to be modified, new objects will be appended to this file
-    :param unit_type: name (str) of Unit Type for ScheduleTypeLimits object - default is dimensionless
-    """
+def _custom_data_tracking_idf(custom_name: str, unit_type: str = 'Dimensionless') -> str:
+    """Returns the IDF text of the ScheduleTypeLimits, Schedule:Constant, and Output:Variable for custom tracking."""
 
     allowable_unit_types = ['dimensionless', 'temperature', 'deltatemperature', 'precipitationRate', 'angle',
                             'convection coefficient', 'activity level', 'velocity', 'capacity', 'power', 'availability',
@@ -83,22 +104,55 @@ def insert_custom_data_tracking(custom_name: str, idf_file_path: str, unit_type:
                       '\tTimestep;',
                       '! ----------------------------------------------------------------------']
 
-    # create, write, then delete temporary file, used for appending
-    temp_file = '_temp_write'
-    with open(temp_file, 'w') as idf:
-        idf.writelines('\n')
-        idf.writelines(f'!----------- Custom Schedule Tracking ({custom_name[:-1]}) -----------')
-        idf.writelines('\n')
-        idf.writelines('\n'.join(schedule_type_limit_obj))
-        idf.writelines('\n\n')
-        idf.writelines('\n'.join(schedule_const_obj))  # insert schedule obj for actutation
-        idf.writelines('\n\n')
-        idf.writelines('\n'.join(output_var_obj))  # insert output var for SQL
-        # append temp IDF to base IDF
-
-    append_idf(idf_file_path, temp_file)
-    # delete temp IDF
-    os.remove(temp_file)
+    return ('\n'
+            f'!----------- Custom Schedule Tracking ({custom_name[:-1]}) -----------'
+            '\n'
+            + '\n'.join(schedule_type_limit_obj)
+            + '\n\n'
+            + '\n'.join(schedule_const_obj)  # insert schedule obj for actutation
+            + '\n\n'
+            + '\n'.join(output_var_obj))  # insert output var for SQL
+
+
+def insert_custom_data_tracking(custom_name: str, idf_file_path: str, unit_type: str = 'Dimensionless'):
+    """
+    This inserts an workaround into the IDF to allow for custom data insertion and tracking through EnergyPlys.
+
+    This feature is useful if you want to track your own data as an "Output:Variable", thus including it in the SQL
+    output generation, and usable in DView.
+    This is done by creating a "Schedule:Const" object, then the user must utilize a schedule actuator to insert data
+    at each timestep. Thus, both a "Output:Variable" and "Schedule:Const" will be created.
+    The ScheduleTypeLimits are also created accordingly to meet specifications for the custom Schedule:Const.
+
+    Using this with the ToC Actuators is shown as such, where 'Custom Data Tracked' is your name for the IDF object and
+    'my_data_var' is used to reference it via ToC in your script.
+    Ex:
+        'my_data_var': ['Schedule:Constant', 'Schedule Value', 'Custom Data Tracked'],
+
+    :param custom_name: name (str) of data object to create and track (can have spaces).
+    :param idf_file_path: Path to IDF model file to be modified, new objects will be appended to this file
+    :param unit_type: name (str) of Unit Type for ScheduleTypeLimits object - default is dimensionless
+    """
+
+    append_idf(idf_file_path, io.StringIO(_custom_data_tracking_idf(custom_name, unit_type)))
+
+    return 0
+
+
+def insert_custom_data_tracking_many(custom_data: list, idf_file_path: str):
+    """
+    Same as insert_custom_data_tracking() for multiple custom data objects, but the IDF file is only appended once.
+
+    :param custom_data: list of (custom_name, unit_type) pairs, see insert_custom_data_tracking() for each argument
+    :param idf_file_path: Path to IDF model file to be modified, new objects will be appended to this file
+    """
+
+    if not custom_data:
+        return 0
+
+    # build all objects first, so invalid input does not leave the IDF partially modified
+    custom_idf = '\n'.join(_custom_data_tracking_idf(custom_name, unit_type) for custom_name, unit_type in custom_data)
+    append_idf(idf_file_path, io.StringIO(custom_idf))
 
     return 0
 
@@ -4,10 +4,15 @@ MDP = Markov Decision Process, and reference to Reinforcement Learning
 """
 
 from collections.abc import Sequence
+from operator import attrgetter
 from typing import Callable
 
+_get_name_and_value = attrgetter('name', 'value')  # bulk (name, value) reads of MdpElements
+
 
 class MdpElement:
+    __slots__ = ('ems_type', 'name', 'handle_identifiers', 'value', 'encoded_value', 'encoding_fxn',
+                 'encoding_fxn_args')
 
     def __init__(self,
                  ems_type: str,
@@ -37,39 +42,39 @@ class MdpElement:
         self.encoding_fxn = encoding_fxn
         self.encoding_fxn_args = [*args]
 
-    def set_encoded_value(self, element_name: str, encoded_value):
+    def set_encoded_value(self, encoded_value):
         """Simply sets encoded value attribute for given EMS element. Done because of constant reuse. Returns value."""
-        setattr(self, element_name + '_encoded_value', encoded_value)
+        self.encoded_value = encoded_value
         return encoded_value
 
-    def set_value(self, element_name: str, value):
-        """Returns encoded value for given EMS element."""
-        setattr(self, element_name + '_value', value)
+    def set_value(self, value):
+        """Sets value attribute for given EMS element. Returns value."""
+        self.value = value
         return value
 
-    def set_encoding_fxn_args(self, element_name: str, *args):
+    def set_encoding_fxn_args(self, *args):
         """Sets encoding function arguments for given EMS element."""
-        setattr(self, element_name + '_encoding_fxn_args', *args)
+        self.encoding_fxn_args = [*args]
 
-    def set_encoding_fxn(self, element_name: str, encoding_fxn):
+    def set_encoding_fxn(self, encoding_fxn):
         """Sets encoding function for given EMS element."""
-        setattr(self, element_name + '_encoding_fxn', encoding_fxn)
+        self.encoding_fxn = encoding_fxn
 
-    def get_encoded_value(self, element_name: str):
+    def get_encoded_value(self):
         """Returns encoded value for given EMS element."""
-        return getattr(self, element_name + '_encoded_value')
+        return self.encoded_value
 
-    def get_value(self, element_name: str):
+    def get_value(self):
         """Returns value for given EMS element."""
-        return getattr(self, element_name + '_value')
+        return self.value
 
-    def get_encoding_fxn_args(self, element_name: str):
+    def get_encoding_fxn_args(self):
         """Returns encoding function arguments for given EMS element."""
-        return getattr(self, element_name + '_encoding_fxn_args')
+        return self.encoding_fxn_args
 
-    def get_encoding_fxn(self, element_name: str):
+    def get_encoding_fxn(self):
         """Returns encoding function for given EMS element."""
-        return getattr(self, element_name + '_encoding_fxn')
+        return self.encoding_fxn
 
 
 class MdpManager:
@@ -140,7 +145,7 @@ class MdpManager:
                       'actuator': tc_actuators}
         for ems_type, ems_tc in master_toc.items():
             for ems_name, tc_values in ems_tc.items():
-                mdp_instance.add_ems_element(ems_type, ems_name, *tc_values[0:])
+                mdp_instance.add_ems_element(ems_type, ems_name, *tc_values)
 
         return mdp_instance
 
@@ -149,15 +154,38 @@ class MdpManager:
         A manager class for all the created EMS element objects. Each MDP element added creates a new MdpElement
         instance and attribute referencing that MdpElement obj.
         """
-        # store EMS element variable names and handle IDs
-        self.tc_var = {}
-        self.tc_intvar = {}
-        self.tc_meter = {}
-        self.tc_weather = {}
-        self.tc_actuator = {}
+        # store EMS element variable names and handle IDs, per EMS type
+        self.tc = {ems_type: {} for ems_type in self.EMS_types}
 
         self.ems_type_dict = {'var': [], 'intvar': [], 'meter': [], 'weather': [], 'actuator': []}
         self.ems_master_list = {}  # stores list of ALL MdpElemnts used
+        self.ems_master_tuple = ()  # ALL MdpElements in order, only created once finalized
+        self.finalized = False
+
+    @property
+    def tc_var(self) -> dict:
+        """ToC of EMS variable names and handle IDs."""
+        return self.tc['var']
+
+    @property
+    def tc_intvar(self) -> dict:
+        """ToC of EMS internal variable names and handle IDs."""
+        return self.tc['intvar']
+
+    @property
+    def tc_meter(self) -> dict:
+        """ToC of EMS meter names and handle IDs."""
+        return self.tc['meter']
+
+    @property
+    def tc_weather(self) -> dict:
+        """ToC of weather names and weather metrics."""
+        return self.tc['weather']
+
+    @property
+    def tc_actuator(self) -> dict:
+        """ToC of EMS actuator names and handle IDs."""
+        return self.tc['actuator']
 
     def add_ems_element(self,
                         ems_type: str,
@@ -178,23 +206,34 @@ class MdpManager:
                      elsewhere manually (say, at runtime) then use NONE for that argument.
         """
         # input checking
+        if self.finalized:
+            raise ValueError(f'MdpManager has been finalized, the EMS element [{ems_element_name}] can not be added.')
         if ems_type not in self.EMS_types:
             raise ValueError(f'EMS Type must be in {self.EMS_types}')
 
-        ems_obj_name = ems_type + '_' + ems_element_name
-        mdp_obj = MdpElement(ems_type,
+        ems_obj = MdpElement(ems_type,
                              ems_element_name,
                              ems_handle_identifiers,
                              encoding_fxn,
                              *args)
-        setattr(self, ems_obj_name, mdp_obj)
+        setattr(self, ems_type + '_' + ems_element_name, ems_obj)
 
         # add to existing attributes
-        getattr(self, 'tc_' + ems_type)[ems_element_name] = ems_handle_identifiers  # add to handle dict
-        ems_obj = getattr(self, ems_obj_name)
+        self.tc[ems_type][ems_element_name] = ems_handle_identifiers  # add to handle dict
         self.ems_type_dict[ems_type].append(ems_obj)
         self.ems_master_list[ems_element_name] = ems_obj
 
+    def finalize(self):
+        """
+        Freezes all EMS elements once they have been added, ideally right before running the simulation.
+
+        Each EMS type list of MdpElements becomes a tuple and a tuple of ALL MdpElements is created, for fixed iteration
+        at runtime. No other EMS elements can be added after.
+        """
+        self.ems_type_dict = {ems_type: tuple(ems_objs) for ems_type, ems_objs in self.ems_type_dict.items()}
+        self.ems_master_tuple = tuple(self.ems_master_list.values())
+        self.finalized = True
+
     def update_ems_value(self, ems_objects_or_names: list, ems_values: list) -> dict:
         """
         Takes list of EMS objects & their values, stores all data, automatically run any encoding functions and returns
@@ -205,17 +244,15 @@ class MdpManager:
         :return: Dict of updated values.
         """
         if len(ems_objects_or_names) != len(ems_values):
-            raise (f'EMS element names {ems_objects_or_names} and their values {ems_values} are out of sync. They '
-                   f'do not consist of the same number of values. They must align, element-wise.')
+            raise ValueError(f'EMS element names {ems_objects_or_names} and their values {ems_values} are out of sync. '
+                             f'They do not consist of the same number of values. They must align, element-wise.')
 
         values_dict = {}
-        for i, ems_name in enumerate(ems_objects_or_names):
+        for ems_obj, value in zip(ems_objects_or_names, ems_values):
             # update current value
-            value = ems_values[i]
-            ems_obj = self.get_mdp_element(ems_name)
-            ems_name = self.get_ems_names([ems_obj])[0]
+            ems_obj = self.get_mdp_element(ems_obj)
             ems_obj.value = value  # update MdpElement
-            values_dict[ems_name] = value  # update dict
+            values_dict[ems_obj.name] = value  # update dict
 
             # run encoding function on new data collected
             if ems_obj.encoding_fxn is not None:
@@ -238,9 +275,8 @@ class MdpManager:
         values_dict = {}
         for ems_name, value in bca_data_dict.items():
             ems_obj = self.get_mdp_element(ems_name)
-            ems_name = self.get_ems_names([ems_obj])[0]
             ems_obj.value = value  # update MdpElement
-            values_dict[ems_name] = value  # update dict
+            values_dict[ems_obj.name] = value  # update dict
 
             # run encoding function on new data collected
             if ems_obj.encoding_fxn is not None:
@@ -253,17 +289,11 @@ class MdpManager:
         """
         Iterates through list of EMS objects (or names) and returns fetched values dictionary.
 
-        :param ems_objects_or_names: List of EMS name(s) or the associated MdpElements that are tracked
+        :param ems_objects_or_names: List of EMS name(s) or the associated MdpElements that are tracked, not mixed
         :return: Dict of values.
         """
 
-        values_dict = {}
-        for ems_obj in ems_objects_or_names:
-            # manage name or MdpElement input
-            ems_obj = self.get_mdp_element(ems_obj)
-            values_dict[ems_obj.name] = ems_obj.value
-
-        return values_dict
+        return dict(map(_get_name_and_value, self._get_mdp_elements(ems_objects_or_names)))
 
     def get_ems_encoded_values(self, ems_objects_or_names: list):
         """
@@ -275,25 +305,21 @@ class MdpManager:
 
         If no encoding function is present, just the normal value is returned.
 
-        :param ems_objects_or_names: List of EMS name(s) or the associated MdpElements that are tracked
+        :param ems_objects_or_names: List of EMS name(s) or the associated MdpElements that are tracked, not mixed
         :return: Dict of encoded values. If NO encoding function available, returns just value.
         """
 
         encoded_values_dict = {}
-        for ems_obj in ems_objects_or_names:
-            # manage name or MdpElement input
-            ems_obj = self.get_mdp_element(ems_obj)
-            encoded_value = ems_obj.encoded_value
-
-            if encoded_value is None and ems_obj.encoding_fxn is not None:
-                # rerun in case of encoding fxn argument changes
-                encoded_value = self.run_encoding_fxn(ems_obj, ems_obj.value)
-            elif ems_obj.encoding_fxn is not None:
-                # return encoded value that was attained when first getting value
-                encoded_value = ems_obj.encoded_value
-            else:
+        for ems_obj in self._get_mdp_elements(ems_objects_or_names):
+            if ems_obj.encoding_fxn is None:
                 # no encoding value, return normal value
                 encoded_value = ems_obj.value
+            else:
+                # return encoded value that was attained when first getting value
+                encoded_value = ems_obj.encoded_value
+                if encoded_value is None:
+                    # rerun in case of encoding fxn argument changes
+                    encoded_value = self.run_encoding_fxn(ems_obj, ems_obj.value)
 
             encoded_values_dict[ems_obj.name] = encoded_value
 
@@ -306,15 +332,15 @@ class MdpManager:
         :returns : associated EMS object (MdpElement) name for that EMS MdpElement.
         """
 
-        if None:
+        if ems_objects is None:
             # All MdpElements
-            ems_objects = self.ems_master_list.values()
+            ems_objects = self.ems_master_tuple if self.finalized else self.ems_master_list.values()
 
         names_list = []
         for ems_obj in ems_objects:
 
             if isinstance(ems_obj, str):
-                if ems_objects not in self.ems_master_list:
+                if ems_obj not in self.ems_master_list:
                     raise ValueError(f'This EMS name, {ems_obj}, is not a tracked MDP element.')
                 else:
                     names_list.append(ems_obj)  # return itself since MdpElement NAME was already passed
@@ -324,6 +350,38 @@ class MdpManager:
 
         return names_list
 
+    def _get_mdp_elements(self, ems_objects_or_names) -> list:
+        """
+        Looks up EMS object instances (MdpElement) from a list of names or MdpElements, checking type once if uniform.
+
+        :returns : list of associated EMS objects (MdpElement), in order.
+        """
+
+        if not isinstance(ems_objects_or_names, (list, tuple)):
+            ems_objects_or_names = list(ems_objects_or_names)  # any iterable, e.g. dict values or generators
+
+        if ems_objects_or_names and isinstance(ems_objects_or_names[0], str):
+            try:
+                return list(map(self.ems_master_list.__getitem__, ems_objects_or_names))
+            except KeyError as e:
+                if isinstance(e.args[0], str):
+                    raise ValueError(f'This EMS name, {e.args[0]}, is not a tracked MDP element.') from None
+        elif all(isinstance(ems_obj, MdpElement) for ems_obj in ems_objects_or_names):
+            return ems_objects_or_names  # MdpElements were already passed
+
+        # mix of names and MdpElements, resolve each
+        mdp_elements = []
+        for ems_obj in ems_objects_or_names:
+            if isinstance(ems_obj, str):
+                if ems_obj not in self.ems_master_list:
+                    raise ValueError(f'This EMS name, {ems_obj}, is not a tracked MDP element.')
+                ems_obj = self.ems_master_list[ems_obj]
+            elif not isinstance(ems_obj, MdpElement):
+                raise ValueError(f'EMS objects must be given as names or MdpElements, not {type(ems_obj)}.')
+            mdp_elements.append(ems_obj)
+
+        return mdp_elements
+
     def get_mdp_element(self, ems_name: str) -> MdpElement:
         """
         Looks up and returns EMS object instance (MdpElement) from its name. Will throw error if cannot find.
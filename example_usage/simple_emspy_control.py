@@ -109,6 +109,7 @@ tc_actuators = {
 
 # -- INSTANTIATE 'MDP' --
 my_mdp = MdpManager.generate_mdp_from_tc(tc_intvars, tc_vars, tc_meters, tc_weather, tc_actuators)
+my_mdp.finalize()  # all EMS elements added, freeze them for runtime
 
 # -- Simulation Params --
 calling_point_for_callback_fxns = EmsPy.available_calling_points[6]  # 5-15 valid for timestep loop during simulation
@@ -161,10 +162,25 @@ class Agent:
         self.weather_names = mdp.get_ems_names(self.weather)
         self.actuator_names = mdp.get_ems_names(self.actuators)
 
+        # direct references to frequently read MdpElements, avoids name lookups every timestep
+        self.zn0_temp_element = mdp.get_mdp_element('zn0_temp')
+        self.oa_db_element = mdp.get_mdp_element('oa_db')
+
         # simulation data state
         self.zn0_temp = None  # deg C
         self.time = None
 
+        # thermostat schedule, fixed for the whole simulation
+        self.work_hours_heating_setpoint = 18  # deg C
+        self.work_hours_cooling_setpoint = 22  # deg C
+        self.off_hours_heating_setpoint = 15  # deg C
+        self.off_hours_cooling_setpoint = 30  # deg C
+        self.work_day_start = datetime.time(6, 0)  # day starts 6 am
+        self.work_day_end = datetime.time(20, 0)  # day ends at 8 pm
+
+        # actuation dictionary, same actuators every step so only the setpoint values are overwritten
+        self.actuation_dict = {'zn0_heating_sp': None, 'zn0_cooling_sp': None}
+
         # print reporting
         self.print_every_x_hours = 2
 
@@ -190,6 +206,8 @@ class Agent:
         """
         # Get specific values from MdpManager based on name
         self.zn0_temp = self.mdp.get_mdp_element('zn0_temp').value
+        # OR from a MdpElement reference cached once at init (cheapest, for values read every timestep)
+        self.zn0_temp = self.zn0_temp_element.value
         # OR get directly from BcaEnv
         self.zn0_temp = self.bca.get_ems_data(['zn0_temp'])
         # OR directly from output
@@ -202,13 +220,14 @@ class Agent:
         # use encoding function values to see temperature in Fahrenheit
         zn0_temp_f = self.mdp.ems_master_list['zn0_temp'].encoded_value  # access the Master list dictionary directly
         outdoor_temp_f = self.mdp.get_mdp_element('oa_db').encoded_value  # using helper function
+        outdoor_temp_f = self.oa_db_element.encoded_value  # using cached MdpElement reference
         # OR call encoding function on multiple elements, even though encoded values are automatically up to date
         encoded_values_dict = self.mdp.get_ems_encoded_values(['oa_db', 'zn0_temp'])
         zn0_temp_f = encoded_values_dict['zn0_temp']
         outdoor_temp_f = encoded_values_dict['oa_db']
 
         # print reporting
-        if self.time.hour % 2 == 0 and self.time.minute == 0:  # report every 2 hours
+        if self.time.hour % self.print_every_x_hours == 0 and self.time.minute == 0:  # report every x hours
             print(f'\n\nTime: {str(self.time)}')
             print('\n\t* Observation Function:')
             print(f'\t\tVars: {var_data}\n\t\tMeters: {meter_data}\n\t\tWeather:{weather_data}')
@@ -216,24 +235,15 @@ class Agent:
             print(f'\t\tOutdoor Temp: {round(outdoor_temp, 2)} C, {round(outdoor_temp_f,2)} F')
 
     def actuation_function(self):
-        work_hours_heating_setpoint = 18  # deg C
-        work_hours_cooling_setpoint = 22  # deg C
-
-        off_hours_heating_setpoint = 15  # deg C
-        off_hours_cooilng_setpoint = 30  # deg C
-
-        work_day_start = datetime.time(6, 0)  # day starts 6 am
-        work_day_end = datetime.time(20, 0)  # day ends at 8 pm
-
-        if work_day_start < self.time.time() < work_day_end:  #
+        if self.work_day_start < self.time.time() < self.work_day_end:  #
             # during workday
-            heating_setpoint = work_hours_heating_setpoint
-            cooling_setpoint = work_hours_cooling_setpoint
+            heating_setpoint = self.work_hours_heating_setpoint
+            cooling_setpoint = self.work_hours_cooling_setpoint
             thermostat_settings = 'Work-Hours Thermostat'
         else:
             # off work
-            heating_setpoint = off_hours_heating_setpoint
-            cooling_setpoint = off_hours_cooilng_setpoint
+            heating_setpoint = self.off_hours_heating_setpoint
+            cooling_setpoint = self.off_hours_cooling_setpoint
             thermostat_settings = 'Off-Hours Thermostat'
 
         # print reporting
@@ -245,10 +255,9 @@ class Agent:
                   )
 
         # return actuation dictionary, referring to actuator EMS variables set
-        return {
-            'zn0_heating_sp': heating_setpoint,
-            'zn0_cooling_sp': cooling_setpoint
-        }
+        self.actuation_dict['zn0_heating_sp'] = heating_setpoint
+        self.actuation_dict['zn0_cooling_sp'] = cooling_setpoint
+        return self.actuation_dict
 
 
 # Create agent instance